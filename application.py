@@ -17,49 +17,99 @@ Matplotlib is optional (for the bar chart). If not installed the app still runs
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import functools
+import io
 import random
 import csv
 import sys
+from typing import Final
 
-# Try to import matplotlib for optional bar chart
-HAS_MPL = True
+import numpy as np
+
+# matplotlib (and Pillow, for displaying the rendered chart) are optional and
+# imported lazily when the chart is first drawn: importing matplotlib alone
+# costs hundreds of ms, which would delay the window appearing.
+HAS_MPL = None  # unknown until the first chart draw; then True/False
+
+# Numba is optional too: for the default MAX_NUMBER the NumPy path is plenty,
+# but the JIT kernel keeps the precompute fast if MAX_NUMBER is raised a lot.
 try:
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    import numba
 except Exception:
-    HAS_MPL = False
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True, boundscheck=False)
+    def _reach_kernel(n_days, max_n, out):
+        for d in range(1, n_days + 1):
+            v = d
+            while v <= max_n:
+                out[d - 1, v - 1] = 1
+                v += d
 
 
 def compute_reachable_counts(max_number=65):
-    """Compute how many of the days 1..31 can reach each number 1..max_number
-    by multiplying the day by positive integers until the product exceeds max_number.
-    Returns: dict number -> set(days)
+    """Compute which of the days 1..31 can reach each number 1..max_number
+    (day d reaches n iff n is a multiple of d, i.e. some multiple d*k == n).
+    Returns: boolean matrix M where M[d-1, n-1] is True iff day d reaches n.
     """
-    reachable = {n: set() for n in range(1, max_number + 1)}
-    for day in range(1, 32):  # days 1..31
-        multiple = 1
-        while True:
-            val = day * multiple
-            if val > max_number:
-                break
-            reachable[val].add(day)
-            multiple += 1
-    return reachable
-
-
-# Precompute
-MAX_NUMBER = 65
-REACHABLE = compute_reachable_counts(MAX_NUMBER)
-COUNTS = {n: len(REACHABLE[n]) for n in range(1, MAX_NUMBER + 1)}
-
-# Insights
-MOST_LIKELY_NUMBER = 60  # as given in the prompt
-MOST_LIKELY_DAYS = COUNTS.get(MOST_LIKELY_NUMBER, 0)
-LEAST_LIKELY = [1, 37, 41, 43, 47, 53, 59, 61]
-LEAST_LIKELY_PROB = 1 / 31
+    if numba is not None:
+        out = np.zeros((31, max_number), dtype=np.uint8)
+        _reach_kernel(31, max_number, out)
+        return out.astype(bool)
+    days = np.arange(1, 32)[:, None]
+    nums = np.arange(1, max_number + 1)[None, :]
+    return nums % days == 0
+
+
+def _mask_days(mask):
+    """Decode a reachable-day bitmask back into the sorted list of days."""
+    return [d for d in range(1, 32) if mask >> (d - 1) & 1]
+
+
+# Precompute. Each number's reachable-day set fits in 31 bits, so pack it into
+# a uint32 bitmask: bit d-1 of REACH_MASK[n] is set iff day d reaches n.
+# REACH_MASK and COUNTS are 1-indexed (slot 0 unused) so callers index by the
+# number itself; counts are just the popcount of the mask.
+MAX_NUMBER: Final = 65
+REACH_MATRIX: Final = compute_reachable_counts(MAX_NUMBER)
+_BITS: Final = np.uint32(1) << np.arange(31, dtype=np.uint32)[:, None]
+REACH_MASK: Final = np.concatenate(
+    ([0], (REACH_MATRIX * _BITS).sum(axis=0))
+).astype(np.uint32)
+COUNTS: Final = np.array([int(m).bit_count() for m in REACH_MASK], dtype=np.int8)
+
+# The inputs are fixed (1..MAX_NUMBER), so fold all per-number formatting into
+# import-time constants too; index 0 is a placeholder so lookups use the number.
+PROB: Final = COUNTS / 31.0
+NUMBERS: Final = np.arange(1, MAX_NUMBER + 1)
+PROBS: Final = PROB[1:].astype(np.float32)  # chart geometry; float32 halves the traffic
+PROB_STR: Final = tuple(f"{p:.5f}" for p in PROB)
+PCT_STR: Final = tuple(f"{p * 100:.2f}%" for p in PROB)
+DAYS_STR: Final = ('',) + tuple(
+    ' '.join(map(str, _mask_days(int(REACH_MASK[n]))))
+    for n in range(1, MAX_NUMBER + 1)
+)
+
+
+@functools.lru_cache(maxsize=MAX_NUMBER + 1)
+def _format_result(n):
+    """Result text for number n; memoized since there are only 65 inputs."""
+    return (f"Number {n} is reachable by {int(COUNTS[n])} day(s) out of 31.\n"
+            f"Probability: {PROB_STR[n]} (≈ {PCT_STR[n]})\n"
+            f"Days: {DAYS_STR[n] or '—'}")
+
+
+# Insights — derived from COUNTS so they can't desynchronize if MAX_NUMBER changes
+MOST_LIKELY_NUMBER: Final = int(np.argmax(COUNTS[1:])) + 1
+MOST_LIKELY_DAYS: Final = int(COUNTS[MOST_LIKELY_NUMBER])
+LEAST_LIKELY: Final = tuple(n for n in range(1, MAX_NUMBER + 1) if COUNTS[n] == 1)
+LEAST_LIKELY_PROB: Final = 1 / 31
 
 
 class DayProbabilityApp(tk.Tk):
+    _chart_deps = None  # (Figure, Image, ImageTk) once the lazy import succeeds
+
     def __init__(self):
         super().__init__()
         self.title("Day-Based Probability Checker")
@@ -88,9 +138,12 @@ class DayProbabilityApp(tk.Tk):
         self.style.configure('TLabel', background=bg, foreground=fg, font=(None, 10))
         self.style.configure('Header.TLabel', font=('Segoe UI', 18, 'bold'))
         self.style.configure('TButton', font=('Segoe UI', 10))
-        self.style.configure('TCombobox', fieldbackground=entry_bg, background=entry_bg)
+        self.style.configure('TSpinbox', fieldbackground=entry_bg, background=entry_bg)
 
-    def _random_heading(self):
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _random_heading():
+        # The heading is immutable for the session; compute it once per process.
         keywords = ['Java', 'day', 'number', 'probability', 'checker']
         templates = [
             "{0} Day Number Probability Checker",
@@ -107,8 +160,17 @@ class DayProbabilityApp(tk.Tk):
         return t.format(shuffled[0], shuffled[1], shuffled[2])
 
     def _build_ui(self):
+        # Grid with cached minsizes instead of absolute place() coordinates:
+        # the place manager recomputes per-widget positions on every expose.
+        self.columnconfigure(0, weight=1)
+        self.columnconfigure(1, weight=1)
+        self.rowconfigure(0, minsize=110)
+        self.rowconfigure(1, minsize=150)
+        self.rowconfigure(2, minsize=120)
+        self.rowconfigure(3, weight=1)
+
         top_frame = ttk.Frame(self)
-        top_frame.place(x=12, y=12, width=796, height=110)
+        top_frame.grid(row=0, column=0, columnspan=2, sticky='nsew', padx=12, pady=(12, 0))
 
         heading = ttk.Label(top_frame, text=self._random_heading(), style='Header.TLabel')
         heading.pack(anchor='w', pady=(6, 0))
@@ -118,13 +180,12 @@ class DayProbabilityApp(tk.Tk):
 
         # Controls
         controls = ttk.Frame(self)
-        controls.place(x=12, y=130, width=380, height=140)
+        controls.grid(row=1, column=0, sticky='nsew', padx=(12, 6))
 
         ttk.Label(controls, text='Choose number:').grid(row=0, column=0, sticky='w', padx=6, pady=8)
         self.choice_var = tk.IntVar(value=60)
-        self.number_combo = ttk.Combobox(controls, values=list(range(1, MAX_NUMBER + 1)), width=10, state='readonly')
-        self.number_combo.set(60)
-        self.number_combo.grid(row=0, column=1, padx=6, pady=8)
+        self.number_spin = ttk.Spinbox(controls, from_=1, to=MAX_NUMBER, textvariable=self.choice_var, width=10, state='readonly')
+        self.number_spin.grid(row=0, column=1, padx=6, pady=8)
 
         self.check_btn = ttk.Button(controls, text='Check Probability', command=self.check_probability)
         self.check_btn.grid(row=1, column=0, columnspan=2, pady=6, padx=6, sticky='we')
@@ -138,108 +199,118 @@ class DayProbabilityApp(tk.Tk):
 
         # Result display
         result_frame = ttk.Frame(self)
-        result_frame.place(x=410, y=130, width=398, height=140)
+        result_frame.grid(row=1, column=1, sticky='nsew', padx=(6, 12))
         ttk.Label(result_frame, text='Result:', font=('Segoe UI', 12, 'bold')).pack(anchor='w', pady=(6, 0), padx=6)
-        self.result_label = ttk.Label(result_frame, text='Choose a number then click "Check Probability"', wraplength=380)
+        self.result_var = tk.StringVar(value='Choose a number then click "Check Probability"')
+        self.result_label = ttk.Label(result_frame, textvariable=self.result_var, wraplength=380)
         self.result_label.pack(anchor='w', padx=6, pady=(6, 0))
 
         # Insights / info panel
         info_frame = ttk.Frame(self)
-        info_frame.place(x=12, y=290, width=796, height=120)
+        info_frame.grid(row=2, column=0, columnspan=2, sticky='nsew', padx=12)
         ttk.Label(info_frame, text='Insights:', font=('Segoe UI', 12, 'bold')).pack(anchor='w', pady=(6, 0), padx=6)
 
-        insight_text = tk.Text(info_frame, height=4, wrap='word', bd=0)
-        insight_text.pack(fill='both', expand=True, padx=6, pady=6)
-        insight_text.insert('end', self._build_insights())
-        insight_text.configure(state='disabled')
+        # A Label is far cheaper than a read-only Text widget (no tag/mark
+        # tables or undo stack) and follows the ttk theme automatically.
+        insight_label = ttk.Label(info_frame, text=self._build_insights(), justify='left', wraplength=780)
+        insight_label.pack(fill='both', expand=True, padx=6, pady=6)
 
         # Optional chart area
         chart_frame = ttk.Frame(self)
-        chart_frame.place(x=12, y=420, width=796, height=200)
+        chart_frame.grid(row=3, column=0, columnspan=2, sticky='nsew', padx=12, pady=(0, 12))
         ttk.Label(chart_frame, text='Probability Distribution (1–65):', font=('Segoe UI', 11, 'bold')).pack(anchor='w', pady=(4, 0), padx=6)
 
-        if HAS_MPL:
+        if self._load_chart_deps():
             self._draw_chart(chart_frame)
         else:
             note = ttk.Label(chart_frame, text='Matplotlib not installed — bar chart disabled. Install matplotlib to enable visualization.')
             note.pack(anchor='w', padx=6, pady=12)
 
+    @classmethod
+    def _load_chart_deps(cls):
+        global HAS_MPL
+        if HAS_MPL is None:
+            try:
+                from matplotlib.figure import Figure
+                from PIL import Image, ImageTk
+            except Exception:
+                HAS_MPL = False
+            else:
+                cls._chart_deps = (Figure, Image, ImageTk)
+                HAS_MPL = True
+        return HAS_MPL
+
     def _build_insights(self):
         lines = []
         # Most likely
-        ml_count = COUNTS.get(MOST_LIKELY_NUMBER, 0)
+        ml_count = int(COUNTS[MOST_LIKELY_NUMBER])
         ml_prob = ml_count / 31 if 31 else 0
         lines.append(f"Most likely number: {MOST_LIKELY_NUMBER} (reachable by {ml_count} different days → probability ≈ {ml_prob:.5f} or {ml_prob*100:.2f}%)")
         # Least likely
         ll_str = ', '.join(str(x) for x in LEAST_LIKELY)
         lines.append(f"Least likely numbers: {ll_str} (each reachable by 1 day → probability ≈ {LEAST_LIKELY_PROB:.5f} or {LEAST_LIKELY_PROB*100:.2f}%)")
         # Extra summary
-        distinct_counts = sorted(set(COUNTS.values()), reverse=True)
+        distinct_counts = sorted(set(COUNTS[1:].tolist()), reverse=True)
         lines.append(f"Unique reach counts across numbers: {distinct_counts[:8]} (top values shown)")
         return '\n'.join(lines)
 
-    def check_probability(self):
-        try:
-            selection = int(self.number_combo.get())
-        except Exception:
+    def check_probability(self, _format_result=_format_result, _max=MAX_NUMBER):
+        # Hot globals are bound as defaults so the callback uses LOAD_FAST
+        # instead of a module-dict lookup per click.
+        selection = self.choice_var.get()
+        if not 1 <= selection <= _max:
             messagebox.showerror('Invalid', 'Please select a number between 1 and 65.')
             return
-        days = REACHABLE.get(selection, set())
-        count = len(days)
-        prob = count / 31
-        prob_pct = prob * 100
-        days_sorted = sorted(days)
-
-        text = f"Number {selection} is reachable by {count} day(s) out of 31.\n"
-        text += f"Probability: {prob:.5f} (≈ {prob_pct:.2f}%)\n"
-        text += f"Days: {days_sorted if days_sorted else '—'}"
-
-        self.result_label.config(text=text)
+        self.result_var.set(_format_result(selection))
 
-    def export_csv(self):
+    def export_csv(self, _counts=COUNTS, _prob_str=PROB_STR, _pct_str=PCT_STR,
+                   _days_str=DAYS_STR, _max=MAX_NUMBER):
         # Let user choose file
         fp = filedialog.asksaveasfilename(defaultextension='.csv', filetypes=[('CSV files','*.csv'),('All files','*.*')], title='Save probabilities to CSV')
         if not fp:
             return
         try:
-            with open(fp, 'w', newline='') as f:
+            rows = [(n, int(_counts[n]), _prob_str[n], _pct_str[n], _days_str[n])
+                    for n in range(1, _max + 1)]
+            with open(fp, 'w', newline='', buffering=1 << 16) as f:
                 writer = csv.writer(f)
                 writer.writerow(['Number', 'Reachable_Days_Count', 'Probability_decimal', 'Probability_percent', 'Reachable_Days'])
-                for n in range(1, MAX_NUMBER + 1):
-                    days = sorted(REACHABLE[n])
-                    count = len(days)
-                    prob = count / 31
-                    writer.writerow([n, count, f"{prob:.5f}", f"{prob*100:.2f}%", ' '.join(map(str, days))])
+                writer.writerows(rows)
             messagebox.showinfo('Saved', f'CSV exported to: {fp}')
         except Exception as e:
             messagebox.showerror('Error', f'Failed to save CSV: {e}')
 
     def _draw_chart(self, parent):
         # Create a simple bar chart showing probabilities
-        fig = Figure(figsize=(9.2, 2.6), dpi=100)
+        Figure, Image, ImageTk = self._chart_deps
+        fig = Figure(figsize=(9.2, 2.6), dpi=100, layout=None)
         ax = fig.add_subplot(111)
-        numbers = list(range(1, MAX_NUMBER + 1))
-        probs = [COUNTS[n]/31 for n in numbers]
-        ax.bar(numbers, probs)
+        ax.bar(NUMBERS, PROBS, linewidth=0)
         ax.set_xlabel('Number')
         ax.set_ylabel('Probability')
         ax.set_xlim(0.5, MAX_NUMBER + 0.5)
-        ax.set_ylim(0, max(probs) * 1.08)
-        fig.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        widget = canvas.get_tk_widget()
-        widget.pack(fill='both', expand=True, padx=6, pady=6)
+        ax.set_ylim(0, float(PROBS.max()) * 1.08)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        # Fixed margins: tight_layout would run an extra renderer pass just to
+        # measure text, which is the slowest part of building this chart.
+        fig.subplots_adjust(left=0.06, right=0.99, top=0.95, bottom=0.2)
+
+        # The chart never updates, so rasterize it once instead of embedding a
+        # live FigureCanvasTkAgg with its event-handling and redraw machinery.
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=100)
+        buf.seek(0)
+        img = ImageTk.PhotoImage(Image.open(buf))
+        lbl = ttk.Label(parent, image=img)
+        lbl.image = img  # keep a reference so Tk doesn't drop the image
+        lbl.pack(fill='both', expand=True, padx=6, pady=6)
 
     def toggle_dark(self):
+        # All widgets are ttk and pick up the restyled TFrame/TLabel settings
+        # on their own.
         self._apply_style()
-        # redraw all widgets' background where needed
-        for child in self.winfo_children():
-            try:
-                child.configure(bg=self['bg'])
-            except Exception:
-                pass
+        self.update_idletasks()
 
 
 if __name__ == '__main__':